@@ -18,7 +18,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
-from metadynamic.ruleset import Categorizer, Propertizer, ProdBuilder, ConstBuilder, VariantBuilder
+from functools import lru_cache
+
+from metadynamic.ruleset import (
+    Categorizer,
+    Propertizer,
+    ProdBuilder,
+    ConstBuilder,
+    VariantBuilder,
+    Compset,
+    Parameters,
+)
 
 from metadynamic.models import polymers
 
@@ -72,13 +82,19 @@ lastonly: VariantBuilder = polymers.lastonly
 # iff the dimer ends corresponds to polymers ends
 # e.g.|   aaa + bbb + ab --> aaabbb + ab
 
-dimer: Categorizer = lambda name: polym(name) and len(name) == 2
+
+@lru_cache(maxsize=None)
+def dimer(name: str) -> bool:  # Categorizer
+    return len(name) == 2 and polym(name)
+
 
 cat_polym: ProdBuilder = lambda names, variant: (names[0] + names[1], names[2])
 
-k_cat_dimer_pol: ConstBuilder = lambda names, k, variant: (
-    k["k_cat"] if names[0][-1] == names[2][0] and names[1][0] == names[2][-1] else 0.0
-)
+
+def k_cat_dimer_pol(names: Compset, k: Parameters, variant: int) -> float:  # ConstBuilder
+    first, second, cat = names
+    return k["k_cat"] if first[-1] == cat[0] and second[0] == cat[-1] else 0.0
+
 
 default_ruleset["categories"].append("dimer")
 
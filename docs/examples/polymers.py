@@ -18,11 +18,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from functools import lru_cache
 
 from metadynamic.ruleset import (
     Categorizer,
-    Propertizer,
     ProdBuilder,
     ConstBuilder,
     VariantBuilder,
@@ -39,25 +39,40 @@ from metadynamic.ruleset import (
 
 polym: Categorizer = lambda name: name.isalpha()
 mono: Categorizer = lambda name: polym(name) and len(name) == 1
-actpol: Categorizer = lambda name: name[-1] == "*" and name[:-1].isalpha()
+
+
+@lru_cache(maxsize=65536)
+def actpol(name: str) -> bool:  # Categorizer
+    return name[-1] == "*" and name[:-1].isalpha()
+
+
 actmono: Categorizer = lambda name: actpol(name) and len(name) == 2
 longpol: Categorizer = lambda name: polym(name) and len(name) > 1
 
 # Propertizer
 
-length: Propertizer = lambda name: (
-    1 if mono(name) else len(name) if polym(name) else len(name) - 1 if actpol(name) else 0
+
+@lru_cache(maxsize=65536)
+def length(name: str) -> int:  # Propertizer
+    # at most one isalpha scan for polymers, two for activated polymers
+    if name.isalpha():
+        return len(name)
+    if name[-1:] == "*" and name[:-1].isalpha():
+        return len(name) - 1
+    return 0
+
+
+#  byte value -> asymmetry weight, shifted by +1 (2: uppercase, 0: lowercase, 1: other)
+asymtable = bytes(
+    2 if 65 <= char <= 90 else 0 if 97 <= char <= 122 else 1 for char in range(256)
 )
 
 
+@lru_cache(maxsize=65536)
 def asym(name: str) -> int:  # Propertizer
-    res = 0
-    for char in name:
-        if char.isupper():
-            res += 1
-        elif char.islower():
-            res -= 1
-    return res
+    # sum of (weight+1) over the name, minus its length
+    code = name.encode()
+    return sum(code.translate(asymtable)) - len(code)
 
 
 right: Categorizer = lambda name: asym(name) > 0
@@ -70,8 +85,12 @@ cut: ProdBuilder = lambda names, variant: (names[0][:variant], names[0][variant:
 act_polym: ProdBuilder = lambda names, variant: (names[0][:-1] + names[1],)
 activ: ProdBuilder = lambda names, variant: (names[0] + "*",)
 deactiv: ProdBuilder = lambda names, variant: (names[0][:-1],)
+
+#  swapped case of (latin-1) characters, avoiding str.swapcase calls
+swapchar: Dict[str, str] = {chr(code): chr(code).swapcase() for code in range(256)}
+
 epimer: ProdBuilder = lambda names, variant: (
-    names[0][:variant] + names[0][variant].swapcase() + names[0][variant + 1 :],
+    names[0][:variant] + swapchar[names[0][variant]] + names[0][variant + 1 :],
 )
 
 
@@ -82,48 +101,73 @@ def samecase(one: str, two: str) -> bool:
     return (one.islower() and two.islower()) or (one.isupper() and two.isupper())
 
 
+@lru_cache(maxsize=65536)
+def cases(name: str) -> Tuple[int, ...]:
+    # case of each character (1: uppercase, -1: lowercase, 0: other)
+    return tuple(1 if char.isupper() else -1 if char.islower() else 0 for char in name)
+
+
+def samecase_at(name: str, one: int, two: int) -> bool:
+    namecases = cases(name)
+    return namecases[one] != 0 and namecases[one] == namecases[two]
+
+
 def samebefore(names: Compset, variant: int) -> bool:
     name = names[0]
-    return variant < (length(name) - 1) and samecase(name[variant], name[variant + 1])
+    return variant < (length(name) - 1) and samecase_at(name, variant, variant + 1)
 
 
 def sameafter(names: Compset, variant: int) -> bool:
     name = names[0]
-    return (variant > 0) and samecase(name[variant], name[variant - 1])
+    return (variant > 0) and samecase_at(name, variant, variant - 1)
+
+
+def firstmono(names: Compset, variant: int) -> bool:
+    return length(names[0]) == 1
+
+
+def sameends(names: Compset, variant: int) -> bool:
+    # same case for the last unit of an activated polymer and the first unit of a polymer
+    end = cases(names[0])[-2]
+    return end != 0 and end == cases(names[1])[0]
+
+
+def samecut(names: Compset, variant: int) -> bool:
+    return samecase_at(names[0], variant - 1, variant)
 
 
 kpol: ConstBuilder = kalternate(
-    condition=lambda names, variant: length(names[0]) == 1,
+    condition=firstmono,
     name_t="kpol_mono",
     name_f="kpol_long",
 )
 
 kpola: ConstBuilder = kalternate(
-    condition=lambda names, variant: samecase(names[0][-2], names[1][0]),
+    condition=sameends,
     name_t="kpola_same",
     name_f="kpola_diff",
 )
 
 kpola_mono: ConstBuilder = kalternate(
-    condition=lambda names, variant: samecase(names[0][-2], names[1][0]),
+    condition=sameends,
     name_t="kpola_mono_same",
     name_f="kpola_mono_diff",
 )
 
 kact: ConstBuilder = kalternate(
-    condition=lambda names, variant: length(names[0]) == 1,
+    condition=firstmono,
     name_t="kact_mono",
     name_f="kact_pol",
 )
 
 kdeact: ConstBuilder = kalternate(
-    condition=lambda names, variant: length(names[0]) == 1,
+    condition=firstmono,
     name_t="kdeact_mono",
     name_f="kdeact_pol",
 )
 
 khyd: ConstBuilder = kalternate(
-    condition=lambda names, variant: samecase(names[0][variant - 1], names[0][variant]),
+    condition=samecut,
     name_t="khyd_same",
     name_f="khyd_diff",
 )
@@ -19,8 +19,9 @@
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
 from typing import Dict, Any
+from functools import lru_cache
 
-from fuzzywuzzy.fuzz import ratio
+from rapidfuzz.fuzz import ratio
 
 from metadynamic.ruleset import (
     Categorizer,
@@ -164,28 +165,68 @@ firstonly: VariantBuilder = singlevariant(num=0)
 lastonly: VariantBuilder = singlevariant(num=-1)
 
 
-#  target compounds as '{abcd}' patterns
-target: Categorizer = lambda name: name[0] == "{" and name[-1] == "}" and polym(
-    name[1:-1]
-)
+@lru_cache(maxsize=None)
+def target(name: str) -> bool:  # Categorizer
+    """ target compounds as '{abcd}' patterns
+    (results are cached, avoiding to slice the name at each call)
+    """
+    return name[0] == "{" and name[-1] == "}" and polym(name[1:-1])
 
 
+@lru_cache(maxsize=None)
 def complex(name: str) -> bool:  # Categorizer
     """ complex compounds are the aggregation of a target and a polymer
     {abcd}:efgh
     """
-    if "." in name:
-        left, right = name.split(".")
-        return polym(right) and target(left)
-    return False
+    sep = name.find(".")
+    if sep < 0:
+        return False
+    return polym(name[sep + 1 :]) and target(name[:sep])
+
+
+def similarity(ref: str, pol: str) -> float:
+    """ similarity ratio (0-100) between a target and a polymer
+
+    a perfect match '{abcd}' ~ 'abcd' only differs by the two braces,
+    so its ratio is directly known without computing an edit distance
+    """
+    if ref[1:-1] == pol:
+        return 100.0 * (1 - 2 / (len(ref) + len(pol)))
+    return float(ratio(ref, pol))
+
+
+#  target/polymer similarity ratios (0-100), stored by complex name
+affinities: Dict[str, float] = {}
+
+
+def affinity(name: str) -> float:
+    """ similarity ratio between the target and the polymer of a complex
+    (computed at complexation, or at first call if not available)
+    """
+    try:
+        return affinities[name]
+    except KeyError:
+        target_name, _, pol = name.partition(".")
+        affinities[name] = similarity(target_name, pol)
+        return affinities[name]
+
+
+def complexation(names: Compset, variant: int) -> Compset:  # ProdBuilder
+    """ join a target and a polymer as a complex,
+    storing their similarity ratio for later dissociation
+    """
+    name = ".".join(names)
+    if name not in affinities:
+        affinities[name] = similarity(*names)
+    return (name,)
 
 
-complexation: ProdBuilder = joiner(sep=".")
 dissociation: ProdBuilder = splitter(sep=".")
 
+
 k_complex: ConstBuilder = kinvar("k_c")
 k_disso: ConstBuilder = lambda names, k, variant: k["k_d"] * k["k_aff"] ** (
-    -float(ratio(*names[0].split("."))) / 100
+    -affinity(names[0]) / 100
 )
 
 
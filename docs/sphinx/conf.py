@@ -12,7 +12,6 @@
 #
 import os
 import sys
-import re
 
 sys.path.insert(0, os.path.abspath("."))
 
@@ -20,16 +19,24 @@ sys.path.insert(0, os.path.abspath("."))
 # for docstring conversion from epytext
 # thanks https://stackoverflow.com/questions/10012741/automated-way-to-switch-from-epydocs-docstring-formatting-to-sphinx-docstring-f
 
-re_field = re.compile("@(param|type|rtype|return|raise)")
+epy_fields = tuple(
+    ("@" + field, ":" + field)
+    for field in ("param", "type", "rtype", "return", "raise")
+)
 
 
 def fix_docstring(app, what, name, obj, options, lines):
-    for i in range(len(lines)):
-        lines[i] = re_field.sub(r":\1", lines[i])
+    for i, line in enumerate(lines):
+        if "@" in line:
+            for epy, rst in epy_fields:
+                line = line.replace(epy, rst)
+            lines[i] = line
 
 
 def setup(app):
     app.connect("autodoc-process-docstring", fix_docstring)
+    # fix_docstring only modifies its own lines, safe for parallel builds (-j auto)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
 
 
 # -- Project information -----------------------------------------------------
@@ -47,12 +54,15 @@ release = "v1.0.2"
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
-extensions = [
-    "sphinx.ext.autodoc",
-#    "sphinx_autodoc_typehints",
-    "sphinxcontrib.autoprogram",
-    "cloud_sptheme.ext.autodoc_sections"
-]
+# Quick API-only builds can be done with SPHINX_EXT=autodoc, only loading autodoc
+# (CLI documentation from autoprogram will then be missing).
+extensions = ["sphinx.ext.autodoc"]
+if os.environ.get("SPHINX_EXT", "full") == "full":
+    extensions += [
+        #    "sphinx_autodoc_typehints",
+        "sphinxcontrib.autoprogram",
+        "cloud_sptheme.ext.autodoc_sections",
+    ]
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
@@ -135,3 +145,9 @@ latex_elements = {
     OuterLinkColor={rgb}{0.3,0.05,0.1}
     """,
 }
+
+# Quick LaTeX builds (e.g. FAST_DOCS=1 make latexpdf): skip the custom fonts,
+# ornaments and typography packages, and the title page relying on them
+if os.environ.get("FAST_DOCS"):
+    latex_elements["preamble"] = ""
+    del latex_elements["maketitle"]
@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Tuple
+
+from metadynamic.caster import Caster
+
+
+def reference_cast(caster: Caster, value: Any) -> Any:
+    """Former (uncompiled) Caster.__call__ behaviour"""
+    if isinstance(value, bytes):
+        value = value.decode()
+    args = [lambda val, arg=arg: reference_cast(arg, val) for arg in caster.args]
+    if caster.dest is dict:
+        return {args[0](key): args[1](val) for key, val in dict(value).items()}
+    if caster.dest is list:
+        return [args[0](val) for val in value]
+    if caster.dest is tuple:
+        if len(args) == 1:
+            return tuple([args[0](val) for val in value])
+        return tuple([conv(val) for conv, val in zip(args, value)])
+    return caster.dest(value)
+
+
+def test_caster() -> None:
+    cases = [
+        (str, b"abc"),
+        (int, b"12"),
+        (float, b"1.5"),
+        (List[str], b"abc"),
+        (List[str], [b"ab", "cd", 3]),
+        (List[int], [1, "2", b"3", 4.5]),
+        (Dict[str, float], {b"a": b"1.5", "b": 2}),
+        (Dict[str, int], [("a", "1"), (b"b", 2.0)]),
+        (Tuple[str, ...], b"xyz"),
+        (Tuple[str, ...], [b"x", "y"]),
+        (Tuple[int, str, float], (b"1", b"two", "3")),
+        (Dict[str, List[Tuple[str, int]]], {b"k": [(b"a", b"1"), ("b", 2.0)]}),
+    ]
+    for target, value in cases:
+        caster = Caster(target)
+        assert caster(value) == reference_cast(caster, value), (target, value)
+    assert Caster(List[str])(b"abc") == ["a", "b", "c"]
@@ -0,0 +1,149 @@
+from os import path
+
+import numpy as np
+import pytest
+from h5py import File
+
+from metadynamic import hdf5
+from metadynamic.ends import FileCreationError
+from metadynamic.hdf5 import (
+    ResultWriter,
+    compress_mode,
+    h5filters,
+    h5repack,
+    h5repack_filter,
+    _replace_repacked,
+)
+from metadynamic.inputs import Param
+from metadynamic.result import ResultReader
+
+BLOSC_UD = "UD=32001,0,7,0,0,0,0,5,2,1"
+"""h5repack form of BLOSC:lz4:5:bitshuffle"""
+
+
+def write_map(filename: str, compress: str) -> int:
+    """Write a small map in a new result file, and return the file size"""
+    writer = ResultWriter(filename, compress=compress)
+    writer.init_log(10)
+    writer.init_stat(["a"], ["length"], Param(), {}, "", 100)
+    for col in range(95):
+        writer.add_data([col])
+    cats = [float(cat) for cat in range(200)]
+    writer.add_map("length", cats, {cat: [cat] * 95 for cat in cats})
+    writer.close()
+    return path.getsize(filename)
+
+
+def test_map_chunks(tmp_path) -> None:
+    rawsize = write_map(str(tmp_path / "raw.hdf5"), "no")
+    gzsize = write_map(str(tmp_path / "gzip.hdf5"), "GZIP=9")
+    # chunks spanning the map lines rather than a mostly empty line per category
+    assert gzsize < rawsize / 2
+    with File(tmp_path / "gzip.hdf5", "r") as h5file:
+        datamap = h5file["Maps/length"]
+        assert datamap.chunks[0] == 1 and datamap.chunks[1] > 1
+        # whole initial map lines (categories + nbcol + lengrow columns)
+        assert datamap.chunks[2] == 111
+        snap = h5file["Snapshots/compounds"]
+        assert snap.chunks[1] == snap.chunks[2] > 1
+
+
+def test_h5filters() -> None:
+    for compress in ("no", "NO", "none", ""):
+        assert h5filters(compress) == {}
+    assert h5filters("GZIP=9") == {
+        "compression": "gzip",
+        "compression_opts": 9,
+        "shuffle": True,
+    }
+    assert h5filters("gzip")["compression_opts"] == 4
+    assert h5filters("LZF") == {"compression": "lzf", "shuffle": True}
+    assert h5filters("lzf") == h5filters("LZF")
+    blosc = h5filters("BLOSC:lz4:5:bitshuffle")
+    assert blosc["compression"] == 32001
+    assert h5filters("blosc") == h5filters("BLOSC:lz4") == blosc
+    assert h5filters("BLOSC:zstd:9:shuffle") != blosc
+    for compress in ("FOO", "SZIP=8,NN", "GZIP=x", "BLOSC:foo", "BLOSC:lz4:5:bad"):
+        with pytest.raises(FileCreationError):
+            h5filters(compress)
+
+
+def test_h5repack_filter() -> None:
+    assert h5repack_filter("no") == ""
+    assert h5repack_filter("GZIP=9") == "GZIP=9"
+    assert h5repack_filter("BLOSC:lz4:5:bitshuffle") == BLOSC_UD
+    # unknown filters are left to h5repack
+    assert h5repack_filter("SZIP=8,NN") == "SZIP=8,NN"
+    for compress in ("LZF", "GZIP=x", "BLOSC:foo"):
+        with pytest.raises(FileCreationError):
+            h5repack_filter(compress)
+
+
+def test_compress_mode() -> None:
+    # serial runs are compressed on the fly, unless only h5repack knows the filter
+    assert compress_mode("no", False) == ("no", "")
+    assert compress_mode("GZIP=9", False) == ("GZIP=9", "")
+    assert compress_mode("LZF", False) == ("LZF", "")
+    assert compress_mode("BLOSC:lz4:5:bitshuffle", False) == (
+        "BLOSC:lz4:5:bitshuffle",
+        "",
+    )
+    assert compress_mode("SZIP=8,NN", False) == ("no", "SZIP=8,NN")
+    # parallel runs are always repacked after the run
+    assert compress_mode("no", True) == ("no", "")
+    assert compress_mode("GZIP=9", True) == ("no", "GZIP=9")
+    assert compress_mode("BLOSC:lz4:5:bitshuffle", True) == ("no", BLOSC_UD)
+    assert compress_mode("SZIP=8,NN", True) == ("no", "SZIP=8,NN")
+    with pytest.raises(FileCreationError):
+        compress_mode("LZF", True)
+    for parallel in (False, True):
+        with pytest.raises(FileCreationError):
+            compress_mode("GZIP=x", parallel)
+
+
+def test_replace_repacked(tmp_path) -> None:
+    filename = tmp_path / "run.hdf5"
+    newname = tmp_path / ".repack.run.hdf5"
+    filename.write_bytes(b"original")
+    newname.write_bytes(b"partial")
+    assert not _replace_repacked(str(newname), str(filename), 1)
+    assert filename.read_bytes() == b"original"
+    assert not newname.exists()
+    newname.write_bytes(b"repacked")
+    assert _replace_repacked(str(newname), str(filename), 0)
+    assert filename.read_bytes() == b"repacked"
+    assert not newname.exists()
+
+
+def test_h5repack(tmp_path, monkeypatch) -> None:
+    filename = tmp_path / "run.hdf5"
+    filename.write_bytes(b"original")
+    commands = []
+
+    def failed_call(command, env=None):
+        commands.append(command)
+        with open(command[-1], "wb") as out:
+            out.write(b"partial")
+        return 1
+
+    monkeypatch.setattr(hdf5, "call", failed_call)
+    assert not h5repack(str(filename), "BLOSC:lz4:5:bitshuffle")
+    assert commands == [
+        ["h5repack", "-f", BLOSC_UD, str(filename), str(tmp_path / ".repack.run.hdf5")]
+    ]
+    # a failed repack leaves the original file untouched
+    assert filename.read_bytes() == b"original"
+    assert [item.name for item in tmp_path.iterdir()] == ["run.hdf5"]
+
+
+def test_compressed_roundtrip(tmp_path) -> None:
+    raw = str(tmp_path / "raw.hdf5")
+    write_map(raw, "no")
+    rawres = ResultReader(raw)
+    for compress in ("GZIP=9", "LZF", "BLOSC:lz4:5:bitshuffle"):
+        filename = str(tmp_path / f"{compress.split(':')[0]}.hdf5")
+        write_map(filename, compress)
+        res = ResultReader(filename)
+        assert res.data.compression is not None
+        assert np.array_equal(res["a"], rawres["a"], equal_nan=True)
+        assert np.array_equal(res["length"], rawres["length"], equal_nan=True)
@@ -0,0 +1,18 @@
+from metadynamic import LOGGER
+from metadynamic.inputs import Param
+from metadynamic.launcher import launch
+
+
+def test_launch_param() -> None:
+    param = Param.readfile("docs/tests/small.json")
+    before = param.asdict()
+    res = launch(param, name="Launched", tend=0.5)
+    LOGGER.info(f"Finished: {res}")
+    LOGGER.disconnect()
+    # the run used the additional parameters...
+    assert res.parameters.name == "Launched"
+    assert res.parameters.tend == 0.5
+    # ...that were not applied to the caller's Param
+    assert param.asdict() == before
+    assert param.name == "Small"
+    assert param.tend == 1.0
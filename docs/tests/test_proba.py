@@ -0,0 +1,45 @@
+from random import Random
+
+import pytest
+
+from metadynamic.proba import Probalist
+
+
+def test_update_pending() -> None:
+    rand = Random(42)
+    # small increments for also testing array extensions
+    probalist = Probalist(maxlength=8)
+    registered = {}
+    total = 0
+    for turn in range(200):
+        # register new objects, eventually reusing freed slots
+        for num in range(rand.randint(0, 5)):
+            obj = f"obj{turn}-{num}"
+            pos = probalist.register(obj)
+            assert pos not in registered
+            registered[pos] = obj
+            total += 1
+            if rand.random() < 0.5:
+                probalist.update(pos, rand.random())
+        # unregister some of them
+        for pos in rand.sample(sorted(registered), min(len(registered), 2)):
+            probalist.unregister(pos)
+            del registered[pos]
+        # batched updates, at most once per position
+        for pos in rand.sample(sorted(registered), len(registered) // 2):
+            probalist.update_later(pos, rand.random() * 10)
+        probalist.update_pending()
+        assert probalist.probtot == pytest.approx(probalist._problist.sum())
+        for pos, obj in registered.items():
+            assert probalist._mapobj[pos] == obj
+    # freed slots were reused
+    assert probalist._actlist < total
+
+
+def test_update_later_duplicate() -> None:
+    probalist = Probalist()
+    pos = probalist.register("obj")
+    probalist.update_later(pos, 1.0)
+    probalist.update_later(pos, 2.0)
+    with pytest.raises(AssertionError):
+        probalist.update_pending()
@@ -1,65 +1,106 @@
 #!/usr/bin/env -S python3 -O
 
 from argparse import ArgumentParser
-from subprocess import call
-from os import rename
 
-from metadynamic import launch
-from metadynamic.inputs import Param
-from metadynamic import MPI_STATUS
-from tempfile import NamedTemporaryFile
 
-parser = ArgumentParser(description="Launch run from a json file")
+def get_parser():
+    parser = ArgumentParser(description="Launch run from a json file")
 
-parser.add_argument("parameters", type=str, help="parameter json file")
-parser.add_argument(
-    "--logdir", metavar="logdir", type=str, nargs="?", help="log file", default=""
-)
-parser.add_argument(
-    "--comment",
-    metavar="comment",
-    type=str,
-    nargs="?",
-    help="comments on the run",
-    default="",
-)
-parser.add_argument(
-    "--loglevel", metavar="loglevel", type=str, nargs="?", help="log level", default=""
-)
-parser.add_argument(
-    "--compress",
-    metavar="compress",
-    type=str,
-    nargs="?",
-    help="log level",
-    default="GZIP=9",
-)
+    parser.add_argument("parameters", type=str, help="parameter json file")
+    parser.add_argument(
+        "--logdir", metavar="logdir", type=str, nargs="?", help="log file", default=""
+    )
+    parser.add_argument(
+        "--comment",
+        metavar="comment",
+        type=str,
+        nargs="?",
+        help="comments on the run",
+        default="",
+    )
+    parser.add_argument(
+        "--loglevel",
+        metavar="loglevel",
+        type=str,
+        nargs="?",
+        help="log level",
+        default="",
+    )
+    parser.add_argument(
+        "--compress",
+        metavar="compress",
+        type=str,
+        nargs="?",
+        help="hdf5 compression filter (default: no compression)",
+        default="no",
+    )
+    parser.add_argument(
+        "--chunk",
+        metavar="chunk",
+        type=int,
+        nargs="?",
+        help="size of compressed hdf5 chunks in kB (small chunks slow down compression)",
+        default=0,
+    )
+    return parser
 
-args = parser.parse_args()
 
-if MPI_STATUS.root:
-    print(f"Launched run '{args.comment}' on {MPI_STATUS.size} processes...")
+def main():
+    parser = get_parser()
+    args = parser.parse_args()
 
-param = Param.readfile(args.parameters)
+    # metadynamic is only imported once the command line is validated
+    from metadynamic import launch
+    from metadynamic import MPI_STATUS
+    from metadynamic.hdf5 import DEFAULT_COMPRESS, compress_mode, h5repack
+    from metadynamic.ends import FileCreationError
 
-kwd = {}
-if args.comment:
-    kwd["comment"] = args.comment
-if args.logdir:
-    kwd["logdir"] = args.logdir
-if args.loglevel:
-    kwd["loglevel"] = args.loglevel
+    is_root = MPI_STATUS.root
+    compress = args.compress or DEFAULT_COMPRESS
+    # check the compression filter before the run
+    try:
+        writer_compress, repack = compress_mode(compress, MPI_STATUS.ismpi)
+    except FileCreationError as err:
+        parser.error(str(err))
 
-res = launch(args.parameters, **kwd)
+    if is_root:
+        print(f"Launched run '{args.comment}' on {MPI_STATUS.size} processes...")
+
+    kwd = {}
+    if args.comment:
+        kwd["comment"] = args.comment
+    if args.logdir:
+        kwd["logdir"] = args.logdir
+    if args.loglevel:
+        kwd["loglevel"] = args.loglevel
+    if not MPI_STATUS.ismpi:
+        # compressed on the fly by the writer
+        kwd["compress"] = writer_compress
+        if args.chunk:
+            kwd["compress_chunk"] = args.chunk
+
+    res = launch(args.parameters, **kwd)
+
+    # filters not applied by the writer: the file is repacked afterwards
+    if repack:
+        # wait for all processes to be done with the file before repacking it
+        if MPI_STATUS.ismpi:
+            MPI_STATUS.comm.Barrier()
+        if is_root:
+            # any error must be caught here, for reaching the next Barrier
+            try:
+                if not h5repack(res.filename, compress):
+                    print("h5repack failed, outputfile is uncompressed")
+            except FileNotFoundError:
+                print("Couldn't find 'h5repack' utility, outputfile is uncompressed")
+            except (OSError, FileCreationError) as err:
+                print(f"Repacking failed ({err}), outputfile is uncompressed")
+        if MPI_STATUS.ismpi:
+            MPI_STATUS.comm.Barrier()
+
+    if is_root:
+        res.writeinfo()
 
-if args.compress != "no" and MPI_STATUS.root:
-    try:
-        old = res.filename
-        new = old + ".repacked"
-        call(["h5repack", "-f", args.compress, old, new])
-        rename(new, old)
-    except FileNotFoundError:
-        print("Couldn't find 'h5repack' utility, outputfile is uncompressed")
 
-if MPI_STATUS.root:
-    print(res.printinfo)
+if __name__ == "__main__":
+    main()
@@ -32,13 +32,40 @@ and reactions.
 """
 
 
+from importlib import import_module
+from typing import Any, Dict
+
 from metadynamic.version import __version__
-from metadynamic.system import System
-from metadynamic.chemical import Crn
-from metadynamic.result import ResultReader
-from metadynamic.launcher import launch
-from metadynamic.logger import LOGGER
-from metadynamic.mpi import MPI_STATUS
+
+_LAZY: Dict[str, str] = {
+    "System": "metadynamic.system",
+    "Crn": "metadynamic.chemical",
+    "ResultReader": "metadynamic.result",
+    "launch": "metadynamic.launcher",
+    "LOGGER": "metadynamic.logger",
+    "MPI_STATUS": "metadynamic.mpi",
+}
+"""Module where each public object is defined, imported only on first access"""
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public object from its module on first access.
+
+    @param name: name of the object
+    @type name: str
+    @return: the requested object
+    @rtype: Any
+
+    @raise AttributeError: if the name is not a public object of the package
+
+    """
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -23,7 +23,12 @@ Implement the L{Caster} class object.
 
 """
 
-from typing import Type, Any, List
+from typing import Type, Any, List, Dict, Callable
+
+
+def _decoded(value: Any) -> Any:
+    """Return the value, decoded as str if given as bytes."""
+    return value.decode() if isinstance(value, bytes) else value
 
 
 class Caster:
@@ -53,6 +58,8 @@ class Caster:
         else:
             self.dest = target
             self.args = []
+        self._dispatch: Callable[[Any], Any] = self.compile()
+        """cast function specialized once for the destination type"""
 
     def __call__(self, value: Any) -> Any:
         """Cast the value to the pre-defined target type.
@@ -61,18 +68,50 @@ class Caster:
         @return: the casted value
 
         """
-        if isinstance(value, bytes):
-            value = value.decode()
+        return self._dispatch(value)
+
+    def compile(self) -> Callable[[Any], Any]:
+        """Flatten the caster tree into a single cast function.
+
+        Nested casters are compiled recursively, and their functions directly
+        called from the container comprehensions, without going through the
+        intermediate Caster objects. As for scalars, bytes values given to
+        containers are first decoded as str.
+
+        @return: function casting a value to the destination type
+        @rtype: Callable[[Any], Any]
+
+        """
+        if not self.args:
+            # int and float already accept str, bytes and numbers
+            return self.dest if self.dest in (int, float) else self._cast_scalar
+        convs = [arg.compile() for arg in self.args]
         if self.dest is dict:
-            return {
-                self.args[0](key): self.args[1](val) for key, val in dict(value).items()
-            }
+            key_cast, val_cast = convs
+
+            def cast_dict(value: Any) -> Dict[Any, Any]:
+                # only copy values that are not yet dictionaries (e.g. pair arrays)
+                value = _decoded(value)
+                items = (value if isinstance(value, dict) else dict(value)).items()
+                return {key_cast(key): val_cast(val) for key, val in items}
+
+            return cast_dict
         if self.dest is list:
-            return [self.args[0](val) for val in value]
+            elt_cast = convs[0]
+            return lambda value: [elt_cast(val) for val in _decoded(value)]
         if self.dest is tuple:
-            if len(self.args) == 1:
-                return tuple([self.args[0](val) for val in value])
-            return tuple([conv(val) for conv, val in zip(self.args, value)])
+            if len(convs) == 1:
+                elt_cast = convs[0]
+                return lambda value: tuple([elt_cast(val) for val in _decoded(value)])
+            return lambda value: tuple(
+                [conv(val) for conv, val in zip(convs, _decoded(value))]
+            )
+        return self._cast_scalar
+
+    def _cast_scalar(self, value: Any) -> Any:
+        """Cast to a non-container type, bytes being first decoded as str."""
+        if isinstance(value, bytes):
+            value = value.decode()
         return self.dest(value)
 
     def __repr__(self) -> str:
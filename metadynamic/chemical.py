@@ -36,64 +36,29 @@ from typing import (
     Dict,
     Any,
     Set,
+    FrozenSet,
     Hashable,
     Tuple,
     Iterable,
-    Union,
+    Optional,
 )
 from math import factorial
-from itertools import repeat
-
-import numpy as np
+from operator import attrgetter
 
 from metadynamic.collector import Collect, Collectable
 from metadynamic.proba import Probalist
 from metadynamic.ends import DecrZero, NoMore, NotFound
-from metadynamic.ruleset import Model, ReacDescr
+from metadynamic.ruleset import Model, ReacDescr, Stoechio
 from metadynamic.inval import invalidint
 from metadynamic.logger import LOGGER
 from metadynamic.inputs import Param
 
 
-class Memcalc:
-    """Function memoizer."""
-
-    def __init__(self, func: Callable[[int], int]):
-        """Create a memoized function.
-
-        @param func: function to memoize
-        @type func:  Callable[[int], int]
-
-        """
-        self.results: Dict[int, int] = {}
-        """results storage"""
-        self.func: Callable[[int], int] = func
-        """memoized function"""
-
-    def __call__(self, val: int) -> int:
-        """Memoized function call.
-
-        @param val: function parameter
-        @type val: int
-        @return: function result
-        @rtype: int
-
-        """
-        try:
-            return self.results[val]
-        except KeyError:
-            self.results[val] = self.func(val)
-            return self.results[val]
-
-
 # only use the value of order! (but often), with order rarely above 3...
-FACT = Memcalc(factorial)
-"""Memoized factorial"""
-
-
-def entro(x: Union[float, int]) -> float:
-    """Return x×ln(x), or 0 if x=0."""
-    return 0.0 if x == 0 else float(x * np.log(x))
+MAXORDER: int = 20
+"""Maximum order for precomputed values (computed on demand above)"""
+FACT: Tuple[int, ...] = tuple(factorial(order) for order in range(MAXORDER + 1))
+"""Precomputed factorials (up to order MAXORDER)"""
 
 
 K = TypeVar("K", bound=Hashable)
@@ -106,6 +71,7 @@ class CollectofCompound(Collect[str, "Compound"]):
     """L{Collect} class for storing a pool of L{Compound}."""
 
     _colltype = "Compound"
+    _entropyprop = "pop"
 
     def _create(self, key: str) -> "Compound":
         """Create a Compound from its key.
@@ -119,13 +85,13 @@ class CollectofCompound(Collect[str, "Compound"]):
         newcomp = Compound(key, self.crn)
         return newcomp
 
-    def _categorize(self, obj: "Compound") -> Set[str]:
+    def _categorize(self, obj: "Compound") -> FrozenSet[str]:
         """List the categories of the Compound.
 
         @param obj: object to catagorize
         @type obj: Compound
         @return: set of categories
-        @rtype: Set[str]
+        @rtype: FrozenSet[str]
 
         """
         return self.model.descriptor.categories(obj.description)
@@ -140,38 +106,36 @@ class CollectofCompound(Collect[str, "Compound"]):
         self.crn: Crn = crn
         """parent CRN"""
 
-    def _getprop(self, prop: str, obj: "Compound") -> float:
-        """Return a given property of a Compound object.
+    def _propfunc(self, prop: str) -> Callable[["Compound"], float]:
+        """Return the function computing a given property of a Compound object.
 
         Shouldn't be directly used (used by proplist method only)
 
         The property may be:
           - "count": returns 1.0
           - "pop": returns the compound population
-          - "entropy": returns pop×log(pop)
+          - "entropy": pop×log(pop), directly computed by proplist
           - other values: a property defined in model.descriptor
 
         @param prop: property name
         @type prop: str
-        @param obj: object to be probed
-        @type obj: "Compound"
-
-        """
-        return float(
-            1.0
-            if prop == "count"
-            else obj.pop
-            if prop == "pop"
-            else entro(obj.pop)
-            if prop == "entropy"
-            else self.model.descriptor.prop(prop, obj.description)
-        )
+        @return: function returning the property value of a Compound
+        @rtype: Callable[[Compound], float]
+
+        """
+        if prop == "count":
+            return lambda obj: 1.0
+        if prop == "pop":
+            return attrgetter("pop")
+        descriptor = self.model.descriptor
+        return lambda obj: descriptor.prop(prop, obj.description)
 
 
 class CollectofReaction(Collect[ReacDescr, "Reaction"]):
     """L{Collect} class for storing a pool of L{Reaction}."""
 
     _colltype = "Reaction"
+    _entropyprop = "rate"
 
     def _create(self, key: ReacDescr) -> "Reaction":
         """Create a Reaction from its key.
@@ -185,7 +149,7 @@ class CollectofReaction(Collect[ReacDescr, "Reaction"]):
         newreac = Reaction(key, self.crn)
         return newreac
 
-    def _categorize(self, obj: "Reaction") -> Set[str]:
+    def _categorize(self, obj: "Reaction") -> Tuple[str]:
         """List the categories of the Reaction.
 
         A reaction belongs to a sole category, its reaction type (i.e. the name of the rule that
@@ -193,11 +157,11 @@ class CollectofReaction(Collect[ReacDescr, "Reaction"]):
 
         @param obj: object to categorize
         @type obj: Reaction
-        @return: set of categories
-        @rtype: Set[str]
+        @return: single category
+        @rtype: Tuple[str]
 
         """
-        return {obj.description[0]}
+        return (obj.description[0],)
 
     def set_crn(self, crn: "Crn") -> None:
         """Set the parent Crn.
@@ -209,40 +173,38 @@ class CollectofReaction(Collect[ReacDescr, "Reaction"]):
         self.crn: Crn = crn
         """Parent CRN"""
 
-    def _getprop(self, prop: str, obj: "Reaction") -> float:
-        """Return a given property of a Reaction object.
+    def _propfunc(self, prop: str) -> Callable[["Reaction"], float]:
+        """Return the function computing a given property of a Reaction object.
 
         Shouldn't be directly used (used by proplist method only)
 
         The property may be:
           - "count": returns 1.0
-          - "pop": returns the compound probability
-          - "entropy": returns proba×log(proba)
+          - "rate": returns the reaction probability
+          - "entropy": proba×log(proba), directly computed by proplist
           - other values: a property defined in model.descriptor
 
         @param prop: property name
         @type prop: str
-        @param obj: object to be probed
-        @type obj: "Compound"
-
-        """
-        return float(
-            1.0
-            if prop == "count"
-            else obj.proba
-            if prop == "rate"
-            else entro(obj.proba)
-            if prop == "entropy"
-            else self.model.descriptor.prop(
-                prop, str(obj.description)
-            )  # Check here... properties of reactions?
-        )
+        @return: function returning the property value of a Reaction
+        @rtype: Callable[[Reaction], float]
+
+        """
+        if prop == "count":
+            return lambda obj: 1.0
+        if prop == "rate":
+            return attrgetter("proba")
+        descriptor = self.model.descriptor
+        # Check here... properties of reactions?
+        return lambda obj: descriptor.prop(prop, obj.descrstr)
 
 
 class Chemical(Generic[K], Collectable):
     """L{Collectable} objects with chemical properties (Generic class)."""
 
     _descrtype = "Chemical"
+    # many chemicals are created, no need for a per-object __dict__
+    __slots__ = ("crn", "description", "activated")
 
     def __init__(self, description: K, crn: "Crn"):
         """Create the object from its 'description', to be linked to the parent 'crn'.
@@ -308,7 +270,20 @@ class Reaction(Chemical[ReacDescr]):
     """L{Chemical} describing a specific reaction."""
 
     _descrtype = "Reaction"
-    _updatelist: Dict[Chemical[ReacDescr], int] = {}
+    __slots__ = (
+        "name",
+        "_descrstr",
+        "proba",
+        "stoechio",
+        "products",
+        "_stoechproduct",
+        "const",
+        "robust",
+        "tobeinitialized",
+        "proba_pos",
+        "registered",
+        "_propensity",
+    )
 
     def __init__(self, description: ReacDescr, crn: "Crn"):
         """Create the reaction from its 'description', to be linked to the parent 'crn'.
@@ -331,12 +306,16 @@ class Reaction(Chemical[ReacDescr]):
         super().__init__(description, crn)
         self.name: str = ""
         """Reaction name"""
+        self._descrstr: str = ""
+        """Description as a string (empty if not built yet)"""
         self.proba: float
         """Reaction probability"""
         self.stoechio: List[Tuple[Compound, int]]
         """Reactants stoechiometry"""
         self.products: List[Tuple[Compound, int]]
-        """Products stoechiometry"""
+        """Products stoechiometry (only stored for robust reactions)"""
+        self._stoechproduct: Optional[Stoechio]
+        """Products names stoechiometry (None if not built yet)"""
         self.const: float
         """Kinetic constant"""
         self.tobeinitialized: bool
@@ -345,16 +324,17 @@ class Reaction(Chemical[ReacDescr]):
         """Probability position in probalist"""
         self.registered: bool
         """registered flag"""
+        self._propensity: Callable[[], float]
+        """Probability computation, specialized for the reaction stoechiometry"""
 
         # If name is empty => invalid reaction, no process to be done
         if description[0] != "":
             self.proba = 0.0
-            (
-                stoechreac,
-                self._stoechproduct,
-                const,
-                self.robust,
-            ) = self.crn.model.buildreac(self.description)
+            stoechreac, const, self.robust = self.crn.model.buildreac(
+                self.description
+            )
+            # products will be built when first needed
+            self._stoechproduct = None
             self.stoechio = []
             order: int = 0
             # stochastic rate between n reactions must be divided by V^(n-1)
@@ -371,8 +351,17 @@ class Reaction(Chemical[ReacDescr]):
                 # /!\  Check if this cannot be computed earlier using ruleset.Parameters facilities
                 #
                 if stoechnum > 1:
-                    self.const /= FACT(stoechnum)
-            self.const /= self.crn.probalist.vol ** (order - 1)
+                    self.const /= (
+                        FACT[stoechnum]
+                        if stoechnum <= MAXORDER
+                        else factorial(stoechnum)
+                    )
+            self.const /= (
+                self.crn.volpow[order - 1]
+                if order <= MAXORDER
+                else self.crn.vol ** (order - 1)
+            )
+            self._propensity = self._build_propensity()
             self.tobeinitialized = True
             self._unset_proba_pos()
 
@@ -415,12 +404,14 @@ class Reaction(Chemical[ReacDescr]):
         if changed:
             # only perform update if something changed
             if newproba != 0.0:
+                probalist = self.crn.probalist
                 if not self.registered:
                     # was unactivated, thus activate
                     self.activate()
-                    self.proba_pos = self.crn.probalist.register(self)
+                    self.proba_pos = probalist.register(self)
                     self.registered = True
-                self.crn.probalist.update(self.proba_pos, newproba)
+                # performed in batch at the end of Crn.update
+                probalist.update_later(self.proba_pos, newproba)
             elif self.registered:
                 # was activated, thus deactivate
                 self.delete()
@@ -428,55 +419,106 @@ class Reaction(Chemical[ReacDescr]):
     def process(self) -> None:
         """Process the reaction, i.e decrement the reactants, increment the products.
 
-        The products are created here (if not created yet by other reactions)
+        The products are built and created here (if not created yet by other reactions)
         at the first processing of the reaction if robust,
         or at each processing if not robust.
 
         Computation can end here if the process results in reaching a 0 total probability
-        (i.e. led to destroy the last reactant of the CRN), raising 'NoMore'
-
-        """
-        if self.tobeinitialized:
-            self.products = [
-                (self.crn.comp_collect[name], order)
-                for name, order in self._stoechproduct
-            ]
-            if self.robust:
+        (i.e. led to destroy the last reactant of the CRN), raising 'NoMore'.
+        A rule building an empty product name raises 'InitError' here,
+        as products are not built at the reaction creation.
+
+        """
+        # Register population changes directly to the crn
+        # (same as calling change_pop for each compound)
+        crn = self.crn
+        comp_toupdate = crn.comp_toupdate
+        if self.robust:
+            if self.tobeinitialized:
+                self.products = [
+                    (crn.comp_collect[name], order)
+                    for name, order in self._build_stoechproduct()
+                ]
                 self.tobeinitialized = False
-            else:
-                self._stoechproduct = self.crn.model.rebuild_prod(self.description)
-        for prod, order in self.products:
-            prod.change_pop(order)
+            for prod, order in self.products:
+                comp_toupdate(prod, order)
+        else:
+            # products rebuilt at each processing, thus used without being stored
+            comp_collect = crn.comp_collect
+            for name, order in crn.model.rebuild_prod(self.description):
+                comp_toupdate(comp_collect[name], order)
         # Decrement reactants
         for reac, order in self.stoechio:
-            reac.change_pop(-order)
-        self.crn.update()
-        if self.crn.probalist.probtot == 0:
+            comp_toupdate(reac, -order)
+        crn.update()
+        if crn.probalist.probtot == 0:
             raise NoMore(f"after processing {self}")
 
-    def _ordern(self, pop: int, order: int) -> int:
-        """Compute stochastic product or order 'n', i.e. pop×(pop-1)×...×(pop-n+1).
-
-        @param pop: population
-        @type pop: int
-        @param order: stochastic order
-        @type order: int
-
-        """
-        return pop if order == 1 else pop * self._ordern(pop - 1, order - 1)
+    def _build_stoechproduct(self) -> Stoechio:
+        """Return the products names stoechiometry, building it if not done yet.
+
+        @return: products names stoechiometry
+        @rtype: Stoechio
+
+        """
+        if self._stoechproduct is None:
+            self._stoechproduct = tuple(self.crn.model.rebuild_prod(self.description))
+        return self._stoechproduct
+
+    def _build_propensity(self) -> Callable[[], float]:
+        """Build the function computing the reaction probability.
+
+        Usual reactions (X, X+Y and 2X) get a dedicated function reading
+        directly the reactant populations; other ones fall back to a generic loop.
+
+        @return: function returning const×pop×(pop-1)×... for all reactants
+        @rtype: Callable[[], float]
+
+        """
+        const = self.const
+        # frozen copy, slightly faster to iterate
+        stoechio = tuple(self.stoechio)
+        if len(stoechio) == 1:
+            reactant, stoechnum = stoechio[0]
+            if stoechnum == 1:
+                return lambda: const * reactant.pop
+            if stoechnum == 2:
+
+                def square() -> float:
+                    pop = reactant.pop
+                    return const * pop * (pop - 1)
+
+                return square
+        elif len(stoechio) == 2 and stoechio[0][1] == stoechio[1][1] == 1:
+            first, second = stoechio[0][0], stoechio[1][0]
+            return lambda: const * first.pop * second.pop
+
+        def generic() -> float:
+            proba = const
+            for reactant, stoechnum in stoechio:
+                pop = reactant.pop
+                if stoechnum == 1:
+                    proba = proba * pop
+                elif stoechnum == 2:
+                    proba = proba * pop * (pop - 1)
+                elif stoechnum == 3:
+                    proba = proba * pop * (pop - 1) * (pop - 2)
+                else:
+                    # pop×(pop-1)×...×(pop-stoechnum+1)
+                    last = pop - stoechnum
+                    while pop > last:
+                        proba *= pop
+                        pop -= 1
+            return proba
+
+        return generic
 
     def updateproba(self) -> Tuple[float, bool]:
         """Update the reaction probability."""
         oldproba = self.proba
-        self.proba = self.const
-        for reactant, stoechnum in self.stoechio:
-            # self.proba *= self._ordern(reactant.pop, stoechnum)
-            pop = reactant.pop
-            self.proba *= pop
-            for _ in repeat(None, stoechnum - 1):
-                pop -= 1
-                self.proba *= pop
-        return self.proba, self.proba != oldproba
+        proba = self._propensity()
+        self.proba = proba
+        return proba, proba != oldproba
 
     def delete(self) -> None:
         """Delete the object."""
@@ -507,12 +549,23 @@ class Reaction(Chemical[ReacDescr]):
             [f"{num}{name}" if num > 1 else str(name) for name, num in stoechio]
         )
 
+    @property
+    def descrstr(self) -> str:
+        """Reaction description as a string, built once when first needed.
+
+        @rtype: str
+
+        """
+        if not self._descrstr:
+            self._descrstr = str(self.description)
+        return self._descrstr
+
     def __str__(self) -> str:
         if not self.name:
             self.name = "->".join(
                 [
                     self._join_compounds(self.stoechio),
-                    self._join_compounds(self._stoechproduct),
+                    self._join_compounds(self._build_stoechproduct()),
                 ]
             )
         return self.name
@@ -522,7 +575,7 @@ class Compound(Chemical[str]):
     """L{Chemical} describing a specific compound."""
 
     _descrtype = "Compound"
-    _updatelist: Dict[Chemical[str], int] = {}
+    __slots__ = ("reactions", "pop")
 
     def __str__(self) -> str:
         #  Already a string, conversion useless, thus overload
@@ -610,11 +663,12 @@ class Compound(Chemical[str]):
         """
         if change != 0:
             pop0 = self.pop
-            self.pop = pop0 + change
-            if self.pop < 0:
+            pop = pop0 + change
+            self.pop = pop
+            if pop < 0:
                 #  population cannot be negative
                 raise DecrZero(self.description)
-            if self.pop == 0:
+            if pop == 0:
                 #  unactivate compounds whose population reaches 0
                 self.unactivate()
             elif pop0 == 0:
@@ -680,6 +734,10 @@ class Crn:
         """Model describing the set of rules"""
         self.vol: float = param.vol
         """System volume"""
+        self.volpow: Tuple[float, ...] = tuple(
+            self.vol ** order for order in range(MAXORDER + 1)
+        )
+        """Precomputed powers of the system volume (up to MAXORDER)"""
         self.dropmode: str = param.dropmode
         """dropmode flag (do we 'drop' or 'keep' inactive reactions?)"""
         self.init_collect()
@@ -761,10 +819,9 @@ class Crn:
         @type change: int
 
         """
-        try:
-            self._comp_update[comp] += change
-        except KeyError:
-            self._comp_update[comp] = change
+        comp_update = self._comp_update
+        # most compounds are new to the list, thus no try/except
+        comp_update[comp] = comp_update.get(comp, 0) + change
 
     def update(self) -> None:
         """Perform a full Crn update.
@@ -772,19 +829,24 @@ class Crn:
         It perform the update of all compounds from the update list.
         These updates place reactions to the next update list
         These reactions are updated
+        Their probability changes are then passed in batch to the probalist
         All update lists are then placed to zero
 
         """
-        for comp, change in self._comp_update.items():
-            # Update compounds
-            comp.update(change)
-            # List impacted reactions
-            for reac in comp.reactions:
-                self.reac_toupdate(reac)
-        self._comp_update = {}
-        for reac in self._reac_update:
+        comp_update = self._comp_update
+        reac_update = self._reac_update
+        for comp, change in comp_update.items():
+            # changes may cancel out (e.g. catalysts), nothing to do then
+            if change:
+                # Update compounds
+                comp.update(change)
+                # List impacted reactions
+                reac_update |= comp.reactions
+        comp_update.clear()
+        for reac in reac_update:
             reac.update()
-        self._reac_update = set()
+        reac_update.clear()
+        self.probalist.update_pending()
 
     def collstat(
         self, collection: str, prop: str, weight: str, method: str, full: bool
@@ -792,7 +854,7 @@ class Crn:
         """Get statistics on compounds if 'collection' is set to 'compounds', else on reactions.
 
         'prop' is the name of the property to be collected as defined in the corresponding
-        Collect._getprop
+        Collect._propfunc
 
         'weight' is the name of another property that will be used as a weight.
 
@@ -834,7 +896,7 @@ class Crn:
         """Get statistic map on compounds if 'collection' is set to 'compounds', else on reactions.
 
         'prop' is the name of the property to be collected as defined in the corresponding
-        Collect._getprop
+        Collect._propfunc
 
         'weight' is the name of another property that will be used as a weight.
 
@@ -24,7 +24,7 @@ collection Collectable objects.
 
 """
 
-from typing import Generic, TypeVar, Dict, Set, Hashable, Any
+from typing import Generic, TypeVar, Dict, Set, Hashable, Any, Callable, Iterable
 from collections import defaultdict
 
 import numpy as np
@@ -37,6 +37,8 @@ from metadynamic.logger import LOGGER
 class Collectable:
     """Generic class, to be derived in classes that will be collected in Collect."""
 
+    __slots__ = ()
+
     def delete(self) -> None:
         """Clean memory of the object.
 
@@ -74,6 +76,8 @@ class Collect(Generic[K, T]):
 
     _colltype = "Generic"
     """string description of the collected object"""
+    _entropyprop = ""
+    """property x from which "entropy" x×ln(x) is computed (empty if not available)"""
 
     def __init__(self, model: Model, categorize: bool = True, dropmode: str = "drop"):
         """Create a collection from a model (for categorizing and building objects).
@@ -191,7 +195,7 @@ class Collect(Generic[K, T]):
         """
         raise NotImplementedError
 
-    def _categorize(self, obj: T) -> Set[str]:
+    def _categorize(self, obj: T) -> Iterable[str]:
         """List the categories the object belongs to.
 
         Must be implemented in subclasses
@@ -199,7 +203,7 @@ class Collect(Generic[K, T]):
         @param obj: object to categorize
         @type obj: T
         @return: list of the categories
-        @rtype: Set[str]
+        @rtype: Iterable[str]
 
         """
         raise NotImplementedError
@@ -228,8 +232,8 @@ class Collect(Generic[K, T]):
         dataset = self.pool if full else self.active
         return {str(val): val.serialize() for val in dataset.values()}
 
-    def _getprop(self, prop: str, obj: T) -> float:
-        """Return a given property of a <T> object.
+    def _propfunc(self, prop: str) -> Callable[[T], float]:
+        """Return the function computing a given property of a <T> object.
 
         Shouldn't be directly used (used by proplist method only)
 
@@ -238,13 +242,15 @@ class Collect(Generic[K, T]):
 
         @param prop: property name
         @type prop: str
-        @param obj: object to be probed
-        @type obj: T
+        @return: function returning the property value of an object
+        @rtype: Callable[[T], float]
+
+        @raise BadFile: if the property is unknown
 
         """
         if prop != "count":
             raise BadFile(f"Unknown property {prop}")
-        return 1.0
+        return lambda obj: 1.0
 
     def proplist(self, prop: str, full: bool = False) -> np.ndarray:
         """Return a list of all property values of the collection.
@@ -260,10 +266,14 @@ class Collect(Generic[K, T]):
         @rtype: nv.ndarray
 
         """
+        if prop == "entropy" and self._entropyprop:
+            values = self.proplist(self._entropyprop, full)
+            # x×ln(x) computed on the whole array, with 0×ln(0) = 0
+            return values * np.log(values, out=np.zeros_like(values), where=values > 0)
         search = self.pool if full else self.active
-        return np.array(
-            [self._getprop(prop, obj) for obj in search.values()], dtype=float
-        )
+        # conversion to float is done by numpy, not by the property getters
+        getprop = self._propfunc(prop)
+        return np.array([getprop(obj) for obj in search.values()], dtype=float)
 
     def stat(self, prop: str, weight: str, method: str, full: bool = False) -> float:
         """Return statistics on all property values of the collection.
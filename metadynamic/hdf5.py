@@ -25,6 +25,9 @@ It provides the L{ResultWriter} class.
 """
 
 from datetime import datetime
+from os import environ, path, remove, replace, statvfs
+from shutil import move
+from subprocess import call
 from typing import Dict, Any, List, Tuple, Mapping, Callable
 from h5py import File, Group, Dataset, string_dtype
 
@@ -37,12 +40,184 @@ from metadynamic.caster import Caster
 from metadynamic.mpi import MPI_GATE, MPI_STATUS
 from metadynamic.version import __version__
 
+try:
+    import hdf5plugin
+except ImportError:  # Blosc compression will not be available
+    hdf5plugin = None
+
 
 comp_cast: Callable[[Any], Dict[str, int]] = Caster(Dict[str, int])
 """Caster to a compound field"""
 reac_cast: Callable[[Any], Dict[str, List[float]]] = Caster(Dict[str, List[float]])
 """Caster to a reaction field"""
 
+DEFAULT_COMPRESS: str = "no"
+"""default compression filter (uncompressed output)"""
+
+
+def h5filters(compress: str) -> Dict[str, Any]:
+    """Convert an h5repack-like filter description to dataset creation options.
+
+    Recognized values are 'GZIP=<level>' (gzip with byte shuffling), 'LZF',
+    'BLOSC:<compressor>:<level>:<shuffle>' (e.g. 'BLOSC:lz4:5:bitshuffle', requiring
+    the hdf5plugin package), and 'no' (or an empty string) for uncompressed datasets.
+
+    @param compress: filter description
+    @type compress: str
+    @return: keyword arguments to be passed to h5py create_dataset
+    @rtype: Dict[str, Any]
+
+    @raise FileCreationError: if the filter is not recognized or not available
+
+    """
+    name, _, level = compress.replace(":", "=", 1).partition("=")
+    name = name.upper()
+    if name in ("", "NO", "NONE"):
+        return {}
+    try:
+        if name == "GZIP":
+            return {
+                "compression": "gzip",
+                "compression_opts": int(level) if level else 4,
+                "shuffle": True,
+            }
+        if name == "LZF":
+            return {"compression": "lzf", "shuffle": True}
+        if name == "BLOSC":
+            if not hdf5plugin:
+                raise FileCreationError("Blosc compression requires hdf5plugin")
+            options = level.split(":") if level else []
+            defaults = ["lz4", "5", "bitshuffle"][len(options) :]
+            cname, clevel, shuffle = options + defaults
+            return dict(
+                hdf5plugin.Blosc(
+                    cname=cname,
+                    clevel=int(clevel),
+                    shuffle=getattr(hdf5plugin.Blosc, shuffle.upper()),
+                )
+            )
+    except (ValueError, KeyError, AttributeError) as err:
+        raise FileCreationError(f"Invalid compression filter '{compress}': {err}")
+    raise FileCreationError(f"Unknown compression filter '{compress}'")
+
+
+def h5repack_filter(compress: str) -> str:
+    """Convert a filter description to a h5repack filter.
+
+    Filters read by L{h5filters} are converted (Blosc to its user-defined filter
+    form), other descriptions are passed unchanged to h5repack (e.g. 'SZIP=8,NN').
+
+    @param compress: filter description
+    @type compress: str
+    @return: h5repack '-f' option value ('' if no compression is requested)
+    @rtype: str
+
+    @raise FileCreationError: if the filter is not available to h5repack
+
+    """
+    try:
+        options = h5filters(compress)
+    except FileCreationError:
+        if compress.upper().startswith(("BLOSC", "GZIP", "LZF")):
+            # invalid options of a known filter
+            raise
+        # not used by ResultWriter, left to h5repack
+        return compress
+    if not options:
+        return ""
+    if options["compression"] == "lzf":
+        raise FileCreationError("LZF compression is not available to h5repack")
+    if not isinstance(options["compression"], int):
+        return compress
+    # user-defined filter, e.g. Blosc
+    cd_values = options["compression_opts"]
+    return f"UD={options['compression']},0,{len(cd_values)}," + ",".join(
+        str(val) for val in cd_values
+    )
+
+
+def compress_mode(compress: str, parallel: bool) -> Tuple[str, str]:
+    """Check a filter description, and choose how it will be applied.
+
+    Filters read by L{h5filters} are applied on the fly by L{ResultWriter}, except
+    for parallel runs (parallel hdf5 cannot write compressed data), whose result
+    file is repacked with h5repack after the run, as for other h5repack filters.
+
+    @param compress: filter description
+    @type compress: str
+    @param parallel: True if the run uses parallel hdf5
+    @type parallel: bool
+    @return: filter to be passed to ResultWriter, and h5repack filter ('' if
+        no repacking is needed)
+    @rtype: Tuple[str, str]
+
+    @raise FileCreationError: if the filter can be applied neither way
+
+    """
+    if not parallel:
+        try:
+            h5filters(compress)
+            return compress, ""
+        except FileCreationError:
+            pass
+    return "no", h5repack_filter(compress)
+
+
+def _replace_repacked(newname: str, filename: str, returncode: int) -> bool:
+    """Replace an hdf5 file by its repacked version, if h5repack succeeded.
+
+    @param newname: name of the repacked file
+    @type newname: str
+    @param filename: name of the original file
+    @type filename: str
+    @param returncode: h5repack return code
+    @type returncode: int
+    @return: True if the file was replaced (else, the repacked file is removed)
+    @rtype: bool
+
+    """
+    if returncode:
+        # failed repack, remove the eventual partial file
+        if path.exists(newname):
+            remove(newname)
+        return False
+    if path.dirname(newname) == path.dirname(filename):
+        replace(newname, filename)
+    else:
+        move(newname, filename)
+    return True
+
+
+def h5repack(filename: str, compress: str) -> bool:
+    """Compress an existing hdf5 file in place with the h5repack utility.
+
+    The file is repacked in a hidden file of the same folder, atomically replacing the
+    original one. If the METADYNAMIC_REPACK_TMPFS environment variable is set, the file
+    is rather repacked in /dev/shm if there is enough room there.
+
+    @param filename: name of the hdf5 file
+    @type filename: str
+    @param compress: filter description, as read by L{h5repack_filter}
+    @type compress: str
+    @return: True if the file was successfully repacked
+    @rtype: bool
+
+    @raise FileNotFoundError: if h5repack utility is not available
+
+    """
+    folder, name = path.split(filename)
+    newname = path.join(folder, ".repack." + name)
+    if environ.get("METADYNAMIC_REPACK_TMPFS"):
+        shm = statvfs("/dev/shm")
+        if shm.f_bavail * shm.f_frsize > 2 * path.getsize(filename):
+            newname = path.join("/dev/shm", ".repack." + name)
+    command = ["h5repack", "-f", h5repack_filter(compress), filename, newname]
+    # make the Blosc filter available to the h5repack subprocess
+    env = (
+        {**environ, "HDF5_PLUGIN_PATH": hdf5plugin.PLUGIN_PATH} if hdf5plugin else None
+    )
+    return _replace_repacked(newname, filename, call(command, env=env))
+
 
 class ResultWriter:
     """Storage for all the simulation data and results."""
@@ -53,6 +228,8 @@ class ResultWriter:
         maxstrlen: int = 256,
         lengrow: int = 10,
         timeformat: str = "%H:%M:%S, %d/%m/%y",
+        compress: str = "no",
+        chunksize: int = 1024,
     ) -> None:
         """Open the hdf5 result file.
 
@@ -65,6 +242,13 @@ class ResultWriter:
         @type lengrow: int
         @param timeformat: time/date formatting string
         @type timeformat: str
+        @param compress: compression filter of the growing datasets, as described in
+            L{h5filters}. Ignored when running in parallel, as parallel hdf5 cannot
+            compress data written independently by each process (Default value = "no")
+        @type compress: str
+        @param chunksize: target size of compressed dataset chunks, in kB. Chunks
+            too small make the filters both slow and inefficient (Default value = 1024)
+        @type chunksize: int
 
         """
         if not isvalid(filename) or filename == "":
@@ -77,13 +261,18 @@ class ResultWriter:
         """maximal remaining data space left empty before adding more space"""
         self.timeformat: str = timeformat
         """time/date formatting string"""
+        self.filters: Dict[str, Any] = {} if MPI_STATUS.ismpi else h5filters(compress)
+        """dataset creation options for compressing data"""
+        self.chunksize: int = chunksize * 1024
+        """target size of compressed dataset chunks, in bytes"""
         self.h5file: File
         """hdf5 file object"""
         try:
             if MPI_STATUS.ismpi:
                 self.h5file = File(filename, "w", driver="mpio", comm=MPI_STATUS.comm)
             else:
-                self.h5file = File(filename, "w")
+                # chunk cache large enough for keeping the chunks being written
+                self.h5file = File(filename, "w", rdcc_nbytes=4 * self.chunksize)
         except OSError as err:
             raise FileCreationError(f"'{filename}': {err}")
         except ValueError as err:
@@ -141,6 +330,55 @@ class ResultWriter:
         self.logs: Dataset
         """hdf5 Dataset 'Logging/logs' (recorded log lines)"""
 
+    def create_dataset(
+        self,
+        group: Group,
+        name: str,
+        shape: Tuple[int, ...],
+        dtype: Any,
+        growing: Tuple[int, ...] = (-1,),
+        **kwd: Any,
+    ) -> Dataset:
+        """Create a dataset, compressed with self.filters.
+
+        Compressed datasets are split in chunks of one process line, of about
+        self.chunksize bytes. Chunks span the whole initial extent of the axes that do
+        not grow, the remaining size being evenly shared between the growing axes (thus
+        giving square tiles for datasets growing along two axes). Chunks never extend
+        beyond the dataset maximum shape.
+
+        @param group: group where the dataset will be created
+        @type group: Group
+        @param name: dataset name
+        @type name: str
+        @param shape: initial dataset shape, first axis being the process number
+        @type shape: Tuple[int, ...]
+        @param dtype: dataset data type (numpy dtype description)
+        @type dtype: Any
+        @param growing: axes along which the dataset will grow (Default value = (-1,))
+        @type growing: Tuple[int, ...]
+        @param kwd: additional h5py create_dataset parameters
+        @return: the created dataset
+        @rtype: Dataset
+
+        """
+        if self.filters:
+            ndim = len(shape)
+            growaxes = {axis % ndim for axis in growing}
+            maxshape = kwd.get("maxshape", shape)
+            chunks = [1] + [
+                1 if axis in growaxes else max(1, shape[axis])
+                for axis in range(1, ndim)
+            ]
+            linesize = np.dtype(dtype).itemsize * int(np.prod(chunks))
+            side = max(1, int((self.chunksize // linesize) ** (1 / len(growaxes))))
+            for axis in growaxes:
+                limit = maxshape[axis]
+                chunks[axis] = side if limit is None else min(side, limit)
+            kwd["chunks"] = tuple(chunks)
+            kwd.update(self.filters)
+        return group.create_dataset(name, shape, dtype=dtype, **kwd)
+
     def init_log(self, maxlog: int) -> None:
         """Init logging interface to hdf5 file.
 
@@ -157,7 +395,8 @@ class ResultWriter:
         self.logcount = self.logging.create_dataset(
             "count", (size,), fillvalue=0, dtype="int32"
         )
-        self.logs = self.logging.create_dataset(
+        self.logs = self.create_dataset(
+            self.logging,
             "logs",
             (size, maxlog),
             maxshape=(size, None),
@@ -267,11 +506,13 @@ class ResultWriter:
         self.dict_as_attr(self.ruleparam, ruleparam)
         self.dataset = self.h5file.create_group("Dataset")
         self.dataset.attrs["datanames"] = datanames
-        self.data = self.dataset.create_dataset(
+        self.data = self.create_dataset(
+            self.dataset,
             "results",
             (size, len(datanames), self.nbcol),
             maxshape=(size, len(datanames), None),
             fillvalue=np.nan,
+            dtype="float32",
         )
         self.end = self.dataset.create_dataset(
             "end",
@@ -283,35 +524,45 @@ class ResultWriter:
             ],
         )
         self.snapshots = self.h5file.create_group("Snapshots")
-        self.timesnap = self.snapshots.create_dataset(
-            "time", (size, 1), maxshape=(size, None), dtype="float32",
+        self.timesnap = self.create_dataset(
+            self.snapshots, "time", (size, 1), maxshape=(size, None), dtype="float32"
         )
-        self.compsnap = self.snapshots.create_dataset(
+        self.compsnap = self.create_dataset(
+            self.snapshots,
             "compounds",
             (size, 1, 1),
             maxshape=(size, None, None),
+            growing=(1, 2),
             dtype=[("name", string_dtype(length=self.maxstrlen)), ("pop", "int32")],
         )
-        self.reacsnap = self.snapshots.create_dataset(
+        self.reacsnap = self.create_dataset(
+            self.snapshots,
             "reactions",
             (size, 1, 1),
             maxshape=(size, None, None),
+            growing=(1, 2),
             dtype=[
                 ("name", string_dtype(length=self.maxstrlen)),
                 ("const", "float32"),
                 ("rate", "float32"),
             ],
         )
-        self.reacsnapsaved = self.snapshots.create_dataset(
-            "reactions_saved", (size, 1), maxshape=(size, None), dtype=bool,
+        self.reacsnapsaved = self.create_dataset(
+            self.snapshots,
+            "reactions_saved",
+            (size, 1),
+            maxshape=(size, None),
+            dtype=bool,
         )
         self._snapsized = False
         self.maps = self.h5file.create_group("Maps")
         for name in mapnames:
-            self.maps.create_dataset(
+            self.create_dataset(
+                self.maps,
                 name,
                 (size, 1, self.nbcol + 1),
                 maxshape=(size, None, None),
+                growing=(1,),
                 fillvalue=np.nan,
                 dtype="float32",
             )
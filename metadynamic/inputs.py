@@ -27,13 +27,18 @@ simulations.
 """
 
 from json import load, dump, JSONDecodeError
-from typing import List, Dict, TypeVar, Type, Any
+from typing import List, Dict, TypeVar, Type, Any, Callable
 from dataclasses import dataclass, field
 from psutil import virtual_memory
 
 from metadynamic.caster import Caster
 from metadynamic.ends import BadFile, FileNotFound, BadJSON
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard json module
+    orjson = None
+
 R = TypeVar("R", bound="Readerclass")
 """Generic type for L{Readerclass} and  its subclasses"""
 
@@ -45,13 +50,23 @@ class LockedError(Exception):
 class Castreader(Caster):
     """Extend a L{Caster} for dealing with L{Readerclass}, converting them as dictionary."""
 
-    def __call__(self, value: Any) -> Any:
-        """Convert 'value' to self.dest type."""
-        if issubclass(self.dest, Readerclass):
-            return self.dest.readdict(value)
-        if self.dest is dict and issubclass(self.args[1].dest, Readerclass):
-            return self.args[1].dest.multipledict(value)
-        return super().__call__(value)
+    def compile(self) -> Callable[[Any], Any]:
+        """Flatten the caster tree into a single cast function.
+
+        L{Readerclass} targets (or dictionaries of them) are read from their dict
+        representation, the other ones are compiled as by L{Caster}.
+
+        @return: function casting a value to the destination type
+        @rtype: Callable[[Any], Any]
+
+        """
+        if isinstance(self.dest, type) and issubclass(self.dest, Readerclass):
+            return self.dest.readdict
+        if self.dest is dict:
+            valdest = self.args[1].dest
+            if isinstance(valdest, type) and issubclass(valdest, Readerclass):
+                return valdest.multipledict
+        return super().compile()
 
 
 @dataclass
@@ -85,8 +100,10 @@ class Readerclass:
         if filename == "":
             return {}
         try:
-            with open(filename) as json_data:
-                parameters: Dict[str, Any] = load(json_data)
+            with open(filename, "rb") as json_data:
+                parameters: Dict[str, Any] = (
+                    orjson.loads(json_data.read()) if orjson else load(json_data)
+                )
         except FileNotFoundError:
             raise FileNotFound(f"Unknown file {filename}")
         except JSONDecodeError as jerr:
@@ -244,17 +261,18 @@ class Readerclass:
 
         """
         err = ""
-        if key not in self.list_param().keys():
+        caster = self.list_param().get(key)
+        if caster is None:
             err += f"'{key}' parameter unknown.\n"
         else:
             if self.autocast:
                 try:
-                    val = self.conv_param(key)(val)
+                    val = caster(val)
                 except ValueError:
-                    err += f"Couldn't cast '{val}' into {self.conv_param(key).dest}. "
+                    err += f"Couldn't cast '{val}' into {caster.dest}. "
             if self.checktype:
-                if not isinstance(val, self.conv_param(key).dest):
-                    err += f"{key} parameter should be of type {self.conv_param(key).dest}, "
+                if not isinstance(val, caster.dest):
+                    err += f"{key} parameter should be of type {caster.dest}, "
                     err += f"not {type(val)}\n"
         if err != "":
             raise BadFile(err)
@@ -306,8 +324,17 @@ class Readerclass:
         @type filename: str
 
         """
-        with open(filename, "w") as out:
-            dump(self.asdict(), out, indent=4)
+        if orjson:
+            with open(filename, "wb") as out:
+                out.write(
+                    orjson.dumps(
+                        self.asdict(),
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+        else:
+            with open(filename, "w") as out:
+                dump(self.asdict(), out, indent=2)
 
     def lock(self) -> None:
         """Lock the object, preventing parameter changes."""
@@ -513,6 +540,11 @@ class Param(Readerclass):
     """number of length left before requesting a resize"""
     maxlog: int = 100
     """max log lines per process to be saved"""
+    compress: str = "no"
+    """hdf5 compression filter ('GZIP=<level>', 'LZF', 'no', or
+    'BLOSC:<compressor>:<level>:<shuffle>', e.g. 'BLOSC:lz4:5:bitshuffle')"""
+    compress_chunk: int = 1024
+    """target size of compressed hdf5 chunks (in kB)"""
     timeformat: str = "[%d.%m.%Y-%H:%M:%S]"
     """timeformat used in log files"""
 
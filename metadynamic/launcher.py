@@ -20,38 +20,48 @@
 
 """High level interface to direct launch a simulation run.
 
-It provides L{launch}, a function for launching a simulation from a .json parameter file, or a .hdf5
-result file from a previous run, with eventual additional parameters, and storing the results in a
-new .hdf5 file.
+It provides L{launch}, a function for launching a simulation from a .json parameter file, a .hdf5
+result file from a previous run, or an already built L{Param} object, with eventual additional
+parameters, and storing the results in a new .hdf5 file.
 
 """
 
 from os import path
-from typing import Any
+from typing import Any, Union
 
 from metadynamic.system import System
+from metadynamic.inputs import Param
 from metadynamic.result import ResultReader
 
 
-def launch(parameters: str, **kwd: Any) -> ResultReader:
+def launch(parameters: Union[str, Param], **kwd: Any) -> ResultReader:
     """Launch a metadynamic run.
 
     It saves the result in a .hdf5 file, and returns a ResulReader object.
 
-    It can be launched either form a .json Param file
-    or from a previous .hdf5 result file.
+    It can be launched either form a .json Param file,
+    from a previous .hdf5 result file, or directly from a Param object
+    (thus avoiding to write and re-read a parameter file).
+    In the latter case, the Param object is copied, and the additional
+    parameters are only applied to the copy.
 
-    @param parameters: name of the parameter file (.json or .hdf5)
-    @type parameters: str
+    @param parameters: name of the parameter file (.json or .hdf5), or Param object
+    @type parameters: Union[str, Param]
     @param kwd: additional parameters (override the one defined in parameters file)
     @return: Interface object to the generated .hdf5 file.
     @rtype: ResultReader
 
     """
-    ext = path.splitext(parameters)[-1]
-    if ext == ".json":
-        syst = System.fromjson(parameters, **kwd)
-    elif ext in (".hdf5", ".h5"):
-        syst = System.fromhdf5(parameters, **kwd)
+    if isinstance(parameters, Param):
+        # work on a copy, the caller's Param is left unchanged
+        param = Param.readdict(parameters.asdict())
+        param.set_param(**kwd)
+        syst = System(param)
+    else:
+        ext = path.splitext(parameters)[-1]
+        if ext == ".json":
+            syst = System.fromjson(parameters, **kwd)
+        elif ext in (".hdf5", ".h5"):
+            syst = System.fromhdf5(parameters, **kwd)
     syst.run()
     return ResultReader(syst.output.h5file)
@@ -24,7 +24,7 @@ It provides L{Probalist}, a class of object storing and performing all probalist
 
 """
 
-from typing import Tuple, Deque, Iterable, Any
+from typing import Tuple, Deque, Iterable, Any, List
 from collections import deque
 from secrets import SystemRandom
 from numba import jit, float64, int32
@@ -90,6 +90,10 @@ class Probalist:
         """total probability"""
         self._queue: Deque[int] = deque()
         """Queue of freed positions"""
+        self._pending_pos: List[int] = []
+        """Storage indices of the delayed probability updates"""
+        self._pending_proba: List[float] = []
+        """New probabilities of the delayed probability updates"""
         self.sysrand: SystemRandom = SystemRandom()
         """random number generator (uses system generator for optimal entropy)"""
 
@@ -148,6 +152,37 @@ class Probalist:
         #  Update the probability of the proba sum
         self.probtot += delta
 
+    def update_later(self, proba_pos: int, proba: float) -> None:
+        """Delay the update of the probability of an object.
+
+        The update is stored, and will be performed with all other
+        delayed updates at next call of update_pending.
+        Each storage index must be passed at most once between two calls
+        of update_pending.
+
+        @param proba_pos: storage index of the object
+        @param proba_pos: int
+        @param proba: new probability
+        @type proba: float
+
+        """
+        self._pending_pos.append(proba_pos)
+        self._pending_proba.append(proba)
+
+    def update_pending(self) -> None:
+        """Perform all delayed probability updates at once."""
+        if self._pending_pos:
+            positions = np.array(self._pending_pos)
+            probas = np.array(self._pending_proba)
+            # assertion shall greatly reduce perf for non-optimized python code!
+            assert len(np.unique(positions)) == len(positions)
+            #  Update the probability of the proba sum from the total change
+            self.probtot += probas.sum() - self._problist[positions].sum()
+            #  Set the new probability of the events
+            self._problist[positions] = probas
+            self._pending_pos.clear()
+            self._pending_proba.clear()
+
     def choose(self) -> Tuple[Any, float]:
         """Choose a probabilistic event according to Gillespie's algorithm.
 
@@ -24,7 +24,8 @@ It provides L{ResultReader}, a class for reading and extracting data from a .hdf
 
 """
 
-from typing import List, Dict, Tuple, Any, Callable, Optional
+import sys
+from typing import List, Dict, Tuple, Any, Callable, Optional, Iterator, TextIO
 from pandas import DataFrame
 from h5py import File, Group, Dataset
 from graphviz import Digraph
@@ -37,6 +38,13 @@ from metadynamic.caster import Caster
 from metadynamic.network import Data2dot
 from metadynamic.chemical import Crn
 
+try:
+    # only imported for registering the Blosc filter, needed for reading
+    # compressed files without loading metadynamic.hdf5
+    import hdf5plugin  # pylint: disable=unused-import
+except ImportError:
+    pass
+
 comp_cast: Callable[[Any], Dict[str, int]] = Caster(Dict[str, int])
 """Caster to a compound field"""
 reac_cast: Callable[[Any], Dict[str, List[float]]] = Caster(Dict[str, List[float]])
@@ -320,7 +328,11 @@ class ResultReader:
         @rtype: str
 
         """
-        endnum, message, time = self.ending(num)
+        return self._endline(num, *self.ending(num))
+
+    @staticmethod
+    def _endline(num: int, endnum: int, message: str, time: float) -> str:
+        """Format the ending information of a thread."""
         return f"#{num}: ending n°{endnum} at runtime t={time}s; {message}"
 
     def table(
@@ -553,6 +565,30 @@ class ResultReader:
             )
         return x, y, z
 
+    def _infolines(self) -> Iterator[str]:
+        """Generate the lines of formated information of the full run.
+
+        The ending information of all threads is read at once from the file.
+
+        @return: information lines
+        @rtype: Iterator[str]
+
+        """
+        attrs = self.run.attrs
+        yield "----------------"
+        yield f"{attrs['comment']}"
+        yield "----------------"
+        yield (
+            f"metadynamic version {attrs['version']}, "
+            f"ran on {attrs['threads']} threads on {attrs['hostname']}"
+        )
+        yield f"from {attrs['date']} to {attrs['end']}"
+        yield f"results saved in '{self.filename}'"
+        yield "----------------"
+        for num, (endnum, message, time) in enumerate(self.end[: attrs["threads"]]):
+            yield self._endline(num, endnum, message.decode(), time)
+        yield "----------------"
+
     @property
     def printinfo(self) -> str:
         """Return formated information of the full run.
@@ -560,25 +596,19 @@ class ResultReader:
         @rtype: str
 
         """
-        version = self.run.attrs["version"]
-        hostname = self.run.attrs["hostname"]
-        start = self.run.attrs["date"]
-        threads = self.run.attrs["threads"]
-        comment = self.run.attrs["comment"]
-        end = self.run.attrs["end"]
-        endline = "\n"
-        return (
-            f"----------------\n"
-            f"{comment}\n"
-            f"----------------\n"
-            f"metadynamic version {version}, "
-            f"ran on {threads} threads on {hostname}\n"
-            f"from {start} to {end}\n"
-            f"results saved in '{self.filename}'\n"
-            f"----------------\n"
-            f"{endline.join([self.endmsg(i) for i in range(threads)])}\n"
-            f"----------------"
-        )
+        return "\n".join(self._infolines())
+
+    def writeinfo(self, out: Optional[TextIO] = None) -> None:
+        """Write formated information of the full run, line by line.
+
+        @param out: text stream where to write (Default value = None, i.e. sys.stdout)
+        @type out: Optional[TextIO]
+
+        """
+        if out is None:
+            out = sys.stdout
+        for line in self._infolines():
+            out.write(line + "\n")
 
     @property
     def runinfo(self) -> Dict[str, Any]:
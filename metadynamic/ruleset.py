@@ -28,8 +28,20 @@ L{Model}), as well as generic generators to be used for building models.
 """
 
 # from types import ModuleType
-from typing import Callable, Dict, KeysView, Tuple, Set, Iterable, List, Any
+from typing import (
+    Callable,
+    Dict,
+    KeysView,
+    Tuple,
+    Set,
+    FrozenSet,
+    Iterable,
+    List,
+    Any,
+)
 from itertools import product
+from functools import lru_cache
+from sys import intern
 
 # from importlib import import_module
 from runpy import run_path
@@ -228,9 +240,11 @@ simply a tuple (prodbuilder,constbuilder,variantbuilder)"""
 ReacDescr = Tuple[str, Compset, int]
 """reaction description as (rule name, reactants, variant)"""
 
-ReacProp = Tuple[Stoechio, Stoechio, float, bool]
+ReacProp = Tuple[Stoechio, float, bool]
 """reaction property, as
-(reactants stoechiometry, products stoechiometry, constant, robustness)"""
+(reactants stoechiometry, constant, robustness)
+
+(products are built separately, see L{Rule.rebuild_prod})"""
 
 
 class Descriptor:
@@ -241,6 +255,8 @@ class Descriptor:
         """Collection of Categorizers"""
         self.prop_dict: Dict[str, Propertizer] = {}
         """Collection of Propertizers"""
+        self._catcache = lru_cache(maxsize=8192)(self._categories)
+        """Cached categories computation, by compound name"""
 
     @property
     def catlist(self) -> KeysView[str]:
@@ -267,16 +283,24 @@ class Descriptor:
         except KeyError:
             return float(self.cat_dict[propname](name))
 
-    def categories(self, name: str) -> Set[str]:
+    def categories(self, name: str) -> FrozenSet[str]:
         """Return the set of categories a compound belongs to.
 
+        The result is computed once per compound name, then kept in a
+        bounded (least recently used) cache.
+
         @param name: name of the compound to be evaluated
         @type name: str
         @return: set of categories
-        @rtype: Set[str]
+        @rtype: FrozenSet[str]
 
         """
-        return {catname for catname, rule in self.cat_dict.items() if rule(name)}
+        return self._catcache(name)
+
+    def _categories(self, name: str) -> FrozenSet[str]:
+        return frozenset(
+            catname for catname, rule in self.cat_dict.items() if rule(name)
+        )
 
     def __repr__(self) -> str:
         return f"Descriptor: {self.cat_dict.keys()}"
@@ -293,6 +317,8 @@ class Descriptor:
         if catname in self.cat_dict:
             raise KeyError(f"Category {catname} already defined")
         self.cat_dict[catname] = rule
+        # categories of already evaluated compounds may change
+        self._catcache.cache_clear()
 
     def add_prop(self, propname: str, func: Propertizer) -> None:
         """Add a new Properizer to the Descriptor.
@@ -312,6 +338,8 @@ class Descriptor:
 class Rule:
     """Describes a given rule for building a reaction."""
 
+    __slots__ = ("name", "reactants", "builder", "descr", "parameters", "robust")
+
     name: str
     """rule name"""
     reactants: Compset
@@ -328,15 +356,19 @@ class Rule:
     def _build_products(self, reactants: Compset, variant: int) -> Compset:
         """Build the set of products from a set of reactants.
 
+        Product names are interned, so that the same compound name is always
+        represented by the same string object (faster dict and cache lookups).
+
         @param reactants: set of reactants
         @type reactants: Compset
         @param variant: reaction variant
         @type variant: int
         @return: set of products
         @rtype: Compset
+        @raise InitError: if a product name is empty
 
         """
-        products: Compset = self.builder[0](reactants, variant)
+        products: Compset = tuple(map(intern, self.builder[0](reactants, variant)))
         if "" in products:
             raise InitError(
                 f"Reaction from {reactants} lead to null compound: {products}"
@@ -359,6 +391,11 @@ class Rule:
     def build(self, description: ReacDescr) -> ReacProp:
         """Build a reaction from its description.
 
+        The products are not built here, but only when needed
+        (using rebuild_prod), as many reactions will never be processed.
+        Invalid (empty) product names are thus only detected, raising
+        InitError, when the reaction is first processed.
+
         @param description: reaction description
         @type description: ReacDescr
         @return: reaction properties
@@ -366,22 +403,17 @@ class Rule:
 
         """
         _, reactants, variant = description
-        products: Compset = self._build_products(reactants, variant)
         constant: float = self._build_constant(reactants, variant)
-        return (
-            self.getstoechio(reactants),
-            self.getstoechio(products),
-            constant,
-            self.robust,
-        )
+        return (self.getstoechio(reactants), constant, self.robust)
 
     def rebuild_prod(self, description: ReacDescr) -> Stoechio:
         """(re)build the list of products generated by the reaction.
 
         @param description: reaction description
         @type description: ReacDescr
-        @return: reactants stoechiometry
+        @return: products stoechiometry
         @rtype: Stoechio
+        @raise InitError: if a product name is empty
 
         """
         _, reactants, variant = description
@@ -595,6 +627,8 @@ class Model:
     def buildreac(self, reacdescr: ReacDescr) -> ReacProp:
         """Build a reaction from its description.
 
+        Products are not included, see L{rebuild_prod}.
+
         @param reacdescr: reaction description
         @type reacdescr: ReacDescr
         @return: reaction properties
@@ -608,8 +642,9 @@ class Model:
 
         @param reacdescr: reaction description
         @type reacdescr: ReacDescr
-        @return: reactants stoechiometry
+        @return: products stoechiometry
         @rtype: Stoechio
+        @raise InitError: if a product name is empty
 
         """
         return self.rules[reacdescr[0]].rebuild_prod(reacdescr)
@@ -480,7 +480,11 @@ class System:
         self.output: Output = Output(self.param)
         """Access to output files and folders"""
         self.writer: ResultWriter = ResultWriter(
-            self.output.h5file, self.param.maxstrlen, self.param.lengrow
+            self.output.h5file,
+            self.param.maxstrlen,
+            self.param.lengrow,
+            compress=self.param.compress,
+            chunksize=self.param.compress_chunk,
         )
         """Writer to HDF5 file."""
         self.writer.init_log(self.param.maxlog)